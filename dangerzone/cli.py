@@ -3,6 +3,7 @@ import sys
 from typing import List, Optional
 
 import click
+import colorama
 from colorama import Back, Fore, Style
 
 from . import args, errors
@@ -72,12 +73,7 @@ def cli_main(
 
     # Validate OCR language
     if ocr_lang:
-        valid = False
-        for lang in dangerzone.ocr_languages:
-            if dangerzone.ocr_languages[lang] == ocr_lang:
-                valid = True
-                break
-        if not valid:
+        if ocr_lang not in dangerzone.ocr_codes:
             click.echo("Invalid OCR language code. Valid language codes:")
             for lang in dangerzone.ocr_languages:
                 click.echo(f"{dangerzone.ocr_languages[lang]}: {lang}")
@@ -140,6 +136,65 @@ def setup_logging() -> None:
         logger.addHandler(ch)
 
 
+_BANNER_BORDER_STYLE = Back.BLACK + Fore.YELLOW + Style.DIM
+_BANNER_LOGO_STYLE = Fore.LIGHTYELLOW_EX + Style.NORMAL
+_BANNER_TEXT_STYLE = Style.RESET_ALL + Back.BLACK + Fore.LIGHTWHITE_EX
+_BANNER_LOGO = (
+    "           ▄██▄           ",
+    "          ██████          ",
+    "         ███▀▀▀██         ",
+    "        ███   ████        ",
+    "       ███   ██████       ",
+    "      ███   ▀▀▀▀████      ",
+    "     ███████  ▄██████     ",
+    "    ███████ ▄█████████    ",
+    "   ████████████████████   ",
+    "    ▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀    ",
+)
+
+
+def _banner_line(content: str) -> str:
+    """Wrap the content of a banner line with its left and right borders."""
+    return (
+        _BANNER_BORDER_STYLE
+        + "│"
+        + content
+        + Fore.YELLOW
+        + Style.DIM
+        + "│"
+        + Style.RESET_ALL
+        + "\n"
+    )
+
+
+# The parts of the banner that do not depend on the Dangerzone version.
+_BANNER_HEAD = (
+    _BANNER_BORDER_STYLE
+    + "╭──────────────────────────╮"
+    + Style.RESET_ALL
+    + "\n"
+    + "".join(_banner_line(_BANNER_LOGO_STYLE + line) for line in _BANNER_LOGO)
+    + _banner_line(" " * 26)
+)
+_BANNER_TAIL = (
+    _banner_line(_BANNER_TEXT_STYLE + " https://dangerzone.rocks ")
+    + _BANNER_BORDER_STYLE
+    + "╰──────────────────────────╯"
+    + Style.RESET_ALL
+    + "\n"
+)
+
+_colorama_initialized = False
+
+
+def _init_colorama_once() -> None:
+    """Initialize terminal colors, the first time we need them."""
+    global _colorama_initialized
+    if not _colorama_initialized:
+        colorama.init(autoreset=True)
+        _colorama_initialized = True
+
+
 def display_banner() -> None:
     """
     Raw ASCII art example:
@@ -159,158 +214,9 @@ def display_banner() -> None:
     │ https://dangerzone.rocks │
     ╰──────────────────────────╯
     """
+    _init_colorama_once()
 
-    print(Back.BLACK + Fore.YELLOW + Style.DIM + "╭──────────────────────────╮")
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "           ▄██▄           "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "          ██████          "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "         ███▀▀▀██         "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "        ███   ████        "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "       ███   ██████       "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "      ███   ▀▀▀▀████      "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "     ███████  ▄██████     "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "    ███████ ▄█████████    "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "   ████████████████████   "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Fore.LIGHTYELLOW_EX
-        + Style.NORMAL
-        + "    ▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀▀    "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(Back.BLACK + Fore.YELLOW + Style.DIM + "│                          │")
-    left_spaces = (15 - len(get_version()) - 1) // 2
-    right_spaces = left_spaces
-    if left_spaces + len(get_version()) + 1 + right_spaces < 15:
-        right_spaces += 1
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Style.RESET_ALL
-        + Back.BLACK
-        + Fore.LIGHTWHITE_EX
-        + Style.BRIGHT
-        + f"{' '*left_spaces}Dangerzone v{get_version()}{' '*right_spaces}"
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-    )
-    print(
-        Back.BLACK
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
-        + Style.RESET_ALL
-        + Back.BLACK
-        + Fore.LIGHTWHITE_EX
-        + " https://dangerzone.rocks "
-        + Fore.YELLOW
-        + Style.DIM
-        + "│"
+    title = _banner_line(
+        _BANNER_TEXT_STYLE + Style.BRIGHT + f"Dangerzone v{get_version()}".center(26)
     )
-    print(Back.BLACK + Fore.YELLOW + Style.DIM + "╰──────────────────────────╯")
+    sys.stdout.write(_BANNER_HEAD + title + _BANNER_TAIL)
@@ -1,13 +1,18 @@
-import gzip
+import functools
+import hmac
+import io
 import json
 import logging
 import os
 import platform
+import queue
 import shlex
 import shutil
+import signal
 import subprocess
 import sys
-from typing import Any, List, Optional, Tuple
+import threading
+from typing import IO, Any, Dict, List, Optional, Tuple
 
 from ..conversion import errors
 from ..document import Document
@@ -16,19 +21,80 @@ from ..util import get_resource_path, get_subprocess_startupinfo
 from .base import PIXELS_TO_PDF_LOG_END, PIXELS_TO_PDF_LOG_START, IsolationProvider
 
 TIMEOUT_KILL = 5  # Timeout in seconds until the kill command returns.
+INSTALL_CHUNK_SIZE = 1024 * 1024  # Bytes to copy at a time when loading the image.
+INSTALL_QUEUE_SIZE = 8  # Chunks to buffer in memory when loading the image.
+# Error messages of Docker and Podman, respectively, when an image does not exist.
+IMAGE_NOT_FOUND_MESSAGES = ("no such image", "image not known")
 
 
-# Define startupinfo for subprocesses
-if platform.system() == "Windows":
-    startupinfo = subprocess.STARTUPINFO()  # type: ignore [attr-defined]
-    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW  # type: ignore [attr-defined]
-else:
-    startupinfo = None
+# Paths of the container runtimes that we have found so far. We do not cache misses,
+# since the user may install Docker Desktop while Dangerzone is running.
+_runtime_paths: Dict[str, str] = {}
 
 
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_expected_image_id() -> str:
+    """Get the ID of the container image that ships with Dangerzone."""
+    with open(get_resource_path("image-id.txt")) as f:
+        return f.read().strip()
+
+
+def _same_image(a: str, b: str) -> bool:
+    """Check if two image IDs refer to the same image.
+
+    Container runtimes may report either the full or the short (truncated) image ID,
+    so we compare the IDs up to the length of the shortest one.
+    """
+    n = min(len(a), len(b))
+    if n == 0:
+        return False
+    return hmac.compare_digest(a[:n].lower(), b[:n].lower())
+
+
+def _copy_in_background(src: io.BufferedIOBase, dst: IO[bytes]) -> None:
+    """Copy a file object to another, reading from it in a separate thread.
+
+    This way, reading (e.g., decompressing) the next chunks overlaps with writing the
+    previous ones. The number of chunks in flight is bounded, to cap memory usage.
+    """
+    chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=INSTALL_QUEUE_SIZE)
+    stop = threading.Event()
+    failures: List[Exception] = []
+
+    def read() -> None:
+        try:
+            while not stop.is_set():
+                chunk = src.read(INSTALL_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.put(chunk)
+        except Exception as e:
+            failures.append(e)
+        finally:
+            chunks.put(None)
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    try:
+        while (chunk := chunks.get()) is not None:
+            dst.write(chunk)
+    finally:
+        # Unblock the reader thread, in case we stopped writing early.
+        stop.set()
+        while reader.is_alive():
+            try:
+                chunks.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        reader.join()
+
+    if failures:
+        raise failures[0]
+
+
 class NoContainerTechException(Exception):
     def __init__(self, container_tech: str) -> None:
         super().__init__(f"{container_tech} is not installed")
@@ -38,6 +104,9 @@ class Container(IsolationProvider):
     # Name of the dangerzone container
     CONTAINER_NAME = "dangerzone.rocks/dangerzone"
 
+    # Whether we have already found the expected container image in this process
+    _image_installed = False
+
     @staticmethod
     def get_runtime_name() -> str:
         if platform.system() == "Linux":
@@ -91,9 +160,12 @@ class Container(IsolationProvider):
     @staticmethod
     def get_runtime() -> str:
         container_tech = Container.get_runtime_name()
-        runtime = shutil.which(container_tech)
+        runtime = _runtime_paths.get(container_tech)
         if runtime is None:
-            raise NoContainerTechException(container_tech)
+            runtime = shutil.which(container_tech)
+            if runtime is None:
+                raise NoContainerTechException(container_tech)
+            _runtime_paths[container_tech] = runtime
         return runtime
 
     @staticmethod
@@ -162,23 +234,55 @@ class Container(IsolationProvider):
         # Load the container into podman
         log.info("Installing Dangerzone container image...")
 
-        p = subprocess.Popen(
-            [Container.get_runtime(), "load"],
-            stdin=subprocess.PIPE,
-            startupinfo=get_subprocess_startupinfo(),
-        )
-
-        chunk_size = 10240
+        container_path = get_resource_path("container.tar")
         compressed_container_path = get_resource_path("container.tar.gz")
-        with gzip.open(compressed_container_path) as f:
-            while True:
-                chunk = f.read(chunk_size)
-                if len(chunk) > 0:
-                    if p.stdin:
-                        p.stdin.write(chunk)
-                else:
-                    break
-        p.communicate()
+        # NOTE: Only look for pigz on Linux, where it's commonly installed. On Windows,
+        # `shutil.which()` may also search the current directory, which could contain
+        # untrusted files.
+        pigz = shutil.which("pigz") if platform.system() == "Linux" else None
+        if os.path.exists(container_path):
+            # The container image layers are already compressed, so the image may be
+            # shipped as a plain tarball, which the container runtime can read directly.
+            p = subprocess.Popen(
+                [Container.get_runtime(), "load", "-i", container_path],
+                startupinfo=get_subprocess_startupinfo(),
+            )
+            p.communicate()
+        elif pigz:
+            # Let pigz decompress the image, and pipe its output directly to the
+            # container runtime, without passing the bytes through Python.
+            gz = subprocess.Popen(
+                [pigz, "-dc", compressed_container_path],
+                stdout=subprocess.PIPE,
+                startupinfo=get_subprocess_startupinfo(),
+            )
+            p = subprocess.Popen(
+                [Container.get_runtime(), "load"],
+                stdin=gz.stdout,
+                startupinfo=get_subprocess_startupinfo(),
+            )
+            assert gz.stdout is not None
+            gz.stdout.close()  # Allow pigz to receive a SIGPIPE if the loader exits
+            p.communicate()
+            # If the container runtime exited first, pigz gets a SIGPIPE. In that case,
+            # we leave it to the check below to report the failure.
+            if gz.wait() not in (0, -signal.SIGPIPE):
+                log.error("Failed to decompress the container image")
+                return False
+        else:
+            # Import gzip only when we need it, since most invocations never install
+            # the container image.
+            import gzip
+
+            p = subprocess.Popen(
+                [Container.get_runtime(), "load"],
+                stdin=subprocess.PIPE,
+                startupinfo=get_subprocess_startupinfo(),
+            )
+            with gzip.open(compressed_container_path) as f:
+                assert p.stdin is not None
+                _copy_in_background(f, p.stdin)
+            p.communicate()
 
         if not Container.is_container_installed():
             log.error("Failed to install the container image")
@@ -192,39 +296,60 @@ class Container(IsolationProvider):
         """
         See if the podman container is installed. Linux only.
         """
+        if Container._image_installed:
+            return True
+
         # Get the image id
-        with open(get_resource_path("image-id.txt")) as f:
-            expected_image_id = f.read().strip()
+        expected_image_id = _get_expected_image_id()
 
-        # See if this image is already installed
+        # See if this image is already installed. We inspect the image directly by its
+        # name, instead of listing and formatting every matching image.
         installed = False
-        found_image_id = subprocess.check_output(
-            [
-                Container.get_runtime(),
-                "image",
-                "list",
-                "--format",
-                "{{.ID}}",
-                Container.CONTAINER_NAME,
-            ],
+        cmd = [
+            Container.get_runtime(),
+            "image",
+            "inspect",
+            "--format",
+            "{{.Id}}",
+            Container.CONTAINER_NAME,
+        ]
+        inspect = subprocess.run(
+            cmd,
+            capture_output=True,
             text=True,
             startupinfo=get_subprocess_startupinfo(),
         )
-        found_image_id = found_image_id.strip()
+        if inspect.returncode != 0:
+            # If the image does not exist, the command fails with a specific error
+            # message. Any other failure (e.g., the Docker daemon is not running) is
+            # unexpected, so we raise it.
+            stderr = inspect.stderr.lower()
+            if not any(msg in stderr for msg in IMAGE_NOT_FOUND_MESSAGES):
+                raise subprocess.CalledProcessError(
+                    inspect.returncode, cmd, inspect.stdout, inspect.stderr
+                )
+            found_image_id = ""
+        else:
+            # Docker prefixes the full image ID with its digest algorithm, whereas our
+            # image-id.txt file contains the short image ID.
+            found_image_id = inspect.stdout.strip().removeprefix("sha256:")
 
-        if found_image_id == expected_image_id:
+        if _same_image(found_image_id, expected_image_id):
             installed = True
+            Container._image_installed = True
         elif found_image_id == "":
             pass
         else:
             log.info("Deleting old dangerzone container image")
 
-            try:
-                subprocess.check_output(
-                    [Container.get_runtime(), "rmi", "--force", found_image_id],
-                    startupinfo=get_subprocess_startupinfo(),
-                )
-            except Exception:
+            # We don't need the output of this command, so we don't capture it.
+            rmi = subprocess.run(
+                [Container.get_runtime(), "rmi", "--force", found_image_id],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                startupinfo=get_subprocess_startupinfo(),
+            )
+            if rmi.returncode != 0:
                 log.warning("Couldn't delete old container image, so leaving it there")
 
         return installed
@@ -274,7 +399,7 @@ class Container(IsolationProvider):
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=self.proc_stderr,
-            startupinfo=startupinfo,
+            startupinfo=get_subprocess_startupinfo(),
         )
 
     def exec_container(
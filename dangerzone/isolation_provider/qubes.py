@@ -141,7 +141,10 @@ def is_qubes_native_conversion() -> bool:
         # This disambiguates if it is running a Qubes targetted build or not
         # (Qubes-specific builds don't ship the container image)
 
-        compressed_container_path = get_resource_path("container.tar.gz")
-        return not os.path.exists(compressed_container_path)
+        container_paths = [
+            get_resource_path("container.tar"),
+            get_resource_path("container.tar.gz"),
+        ]
+        return not any(os.path.exists(path) for path in container_paths)
     else:
         return False
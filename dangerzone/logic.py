@@ -1,41 +1,59 @@
 import concurrent.futures
+import functools
 import json
 import logging
-from typing import Callable, List, Optional
-
-import colorama
+import types
+from typing import TYPE_CHECKING, Callable, List, Mapping, Optional
 
 from . import errors, util
 from .document import Document
 from .isolation_provider.base import IsolationProvider
-from .settings import Settings
 from .util import get_resource_path
 
+if TYPE_CHECKING:
+    from .settings import Settings
+
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_ocr_languages() -> Mapping[str, str]:
+    """Load the languages supported by Tesseract, once per process."""
+    with open(get_resource_path("ocr-languages.json"), "r") as f:
+        unsorted_ocr_languages = json.load(f)
+    return types.MappingProxyType(dict(sorted(unsorted_ocr_languages.items())))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_ocr_codes() -> Mapping[str, str]:
+    """Map the Tesseract language codes back to their language names."""
+    return types.MappingProxyType({v: k for k, v in _load_ocr_languages().items()})
+
+
 class DangerzoneCore(object):
     """
     Singleton of shared state / functionality throughout the app
     """
 
     def __init__(self, isolation_provider: IsolationProvider) -> None:
-        # Initialize terminal colors
-        colorama.init(autoreset=True)
-
         # App data folder
         self.appdata_path = util.get_config_dir()
 
         # Languages supported by tesseract
-        with open(get_resource_path("ocr-languages.json"), "r") as f:
-            unsorted_ocr_languages = json.load(f)
-            self.ocr_languages = dict(sorted(unsorted_ocr_languages.items()))
+        self.ocr_languages = _load_ocr_languages()
+        self.ocr_codes = _load_ocr_codes()
 
-        # Load settings
-        self.settings = Settings(self)
         self.documents: List[Document] = []
         self.isolation_provider = isolation_provider
 
+    @functools.cached_property
+    def settings(self) -> "Settings":
+        # Load settings on first use, so that code paths that never touch them (e.g.,
+        # `--help`) do not pay for importing and reading them.
+        from .settings import Settings
+
+        return Settings(self)
+
     def add_document_from_filename(
         self,
         input_filename: str,
@@ -1,3 +1,4 @@
+import functools
 import pathlib
 import platform
 import subprocess
@@ -8,6 +9,7 @@ from typing import Optional
 import appdirs
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> str:
     return appdirs.user_config_dir("dangerzone")
 
@@ -24,7 +26,12 @@ def get_tmp_dir() -> Optional[str]:
 
 
 def get_resource_path(filename: str) -> str:
-    if getattr(sys, "dangerzone_dev", False):
+    return _get_resource_path(filename, getattr(sys, "dangerzone_dev", False))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_resource_path(filename: str, dangerzone_dev: bool) -> str:
+    if dangerzone_dev:
         # Look for resources directory relative to python file
         project_root = pathlib.Path(__file__).parent.parent
         prefix = project_root / "share"
@@ -45,7 +52,9 @@ def get_resource_path(filename: str) -> str:
     return str(resource_path)
 
 
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
+    # NOTE: The version does not change while Dangerzone is running, so we read it once.
     try:
         with open(get_resource_path("version.txt")) as f:
             version = f.read().strip()
@@ -56,7 +65,10 @@ def get_version() -> str:
     return version
 
 
+@functools.lru_cache(maxsize=1)
 def get_subprocess_startupinfo():  # type: ignore [no-untyped-def]
+    # NOTE: It's safe to share the same object across subprocesses, since
+    # `subprocess.Popen` makes a copy of it before using it.
     if platform.system() == "Windows":
         startupinfo = subprocess.STARTUPINFO()
         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
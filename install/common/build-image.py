@@ -37,6 +37,11 @@ def main():
         default=9,
         help="The Gzip compression level, from 0 (lowest) to 9 (highest, default)",
     )
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Save the container image as an uncompressed tarball in share/container.tar",
+    )
     parser.add_argument(
         "--use-cache",
         action="store_true",
@@ -79,7 +84,25 @@ def main():
             check=True,
         )
 
+        # Make sure that we ship only the container image we build here, since
+        # Dangerzone prefers the uncompressed tarball, if it exists.
         if not args.no_save:
+            Path("share/container.tar").unlink(missing_ok=True)
+            Path("share/container.tar.gz").unlink(missing_ok=True)
+
+        if not args.no_save and args.no_compress:
+            print("Saving container image")
+            subprocess.run(
+                [
+                    args.runtime,
+                    "save",
+                    "-o",
+                    "share/container.tar",
+                    TAG,
+                ],
+                check=True,
+            )
+        elif not args.no_save:
             print("Saving container image")
             cmd = subprocess.Popen(
                 [
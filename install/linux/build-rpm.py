@@ -64,11 +64,16 @@ def build(build_dir, qubes=False):
     os.symlink(dist_path, srpm_dir)
 
     print("* Creating a Python sdist")
-    container_tar_gz = root / "share" / "container.tar.gz"
-    container_tar_gz_bak = root / "container.tar.gz.bak"
-    stash_container = qubes and container_tar_gz.exists()
-    if stash_container:
-        container_tar_gz.rename(container_tar_gz_bak)
+    # The container image may be shipped either compressed or as a plain tarball.
+    container_tarballs = [
+        root / "share" / "container.tar",
+        root / "share" / "container.tar.gz",
+    ]
+    stashed_containers = [
+        path for path in container_tarballs if qubes and path.exists()
+    ]
+    for path in stashed_containers:
+        path.rename(root / f"{path.name}.bak")
     try:
         subprocess.run(["poetry", "build", "-f", "sdist"], cwd=root, check=True)
         # Copy and unlink the Dangerzone sdist, instead of just renaming it. If the
@@ -77,8 +82,8 @@ def build(build_dir, qubes=False):
         shutil.copy2(sdist_path, build_dir / "SOURCES" / sdist_name)
         sdist_path.unlink()
     finally:
-        if stash_container:
-            container_tar_gz_bak.rename(container_tar_gz)
+        for path in stashed_containers:
+            (root / f"{path.name}.bak").rename(path)
 
     print("* Building RPM package")
     cmd = [
@@ -1,13 +1,21 @@
+import gzip
+import io
 import os
 import subprocess
+import threading
 import time
+from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
 
 from dangerzone.document import Document
-from dangerzone.isolation_provider import base
-from dangerzone.isolation_provider.container import Container
+from dangerzone.isolation_provider import base, container
+from dangerzone.isolation_provider.container import (
+    Container,
+    _copy_in_background,
+    _same_image,
+)
 from dangerzone.isolation_provider.qubes import is_qubes_native_conversion
 
 from .base import IsolationProviderTermination, IsolationProviderTest
@@ -101,3 +109,117 @@ class TestContainerTermination(IsolationProviderTermination):
         terminate_proc_spy.assert_called()
         popen_kill_spy.assert_called()
         assert proc.poll() is not None
+
+
+EXPECTED_IMAGE_ID = "0123456789ab"
+FULL_IMAGE_ID = EXPECTED_IMAGE_ID + "cdef" * 13
+
+
+def mock_image_inspect(
+    mocker: MockerFixture, returncode: int, stdout: str = "", stderr: str = ""
+) -> MagicMock:
+    """Mock the output of the `image inspect` command of the container runtime."""
+    mocker.patch.object(Container, "_image_installed", False)
+    mocker.patch.object(Container, "get_runtime", return_value="runtime")
+    mocker.patch(
+        "dangerzone.isolation_provider.container._get_expected_image_id",
+        return_value=EXPECTED_IMAGE_ID,
+    )
+    return mocker.patch(
+        "dangerzone.isolation_provider.container.subprocess.run",
+        return_value=subprocess.CompletedProcess([], returncode, stdout, stderr),
+    )
+
+
+@pytest.mark.parametrize(
+    "stderr",
+    [
+        "Error: No such image: dangerzone.rocks/dangerzone",  # Docker
+        "Error: dangerzone.rocks/dangerzone: image not known",  # Podman
+    ],
+)
+def test_is_container_installed_missing_image(
+    mocker: MockerFixture, stderr: str
+) -> None:
+    run = mock_image_inspect(mocker, returncode=1, stderr=stderr)
+    assert not Container.is_container_installed()
+    # Make sure that we do not attempt to delete an image that does not exist.
+    run.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "image_id",
+    [
+        f"sha256:{FULL_IMAGE_ID}",  # Docker
+        FULL_IMAGE_ID,  # Podman
+    ],
+)
+def test_is_container_installed_full_image_id(
+    mocker: MockerFixture, image_id: str
+) -> None:
+    run = mock_image_inspect(mocker, returncode=0, stdout=f"{image_id}\n")
+    assert Container.is_container_installed()
+    run.assert_called_once()
+
+
+def test_is_container_installed_runtime_error(mocker: MockerFixture) -> None:
+    mock_image_inspect(
+        mocker, returncode=1, stderr="Cannot connect to the Docker daemon"
+    )
+    with pytest.raises(subprocess.CalledProcessError):
+        Container.is_container_installed()
+
+
+@pytest.mark.parametrize(
+    "a, b, same",
+    [
+        (EXPECTED_IMAGE_ID, FULL_IMAGE_ID, True),  # Short against full ID
+        (FULL_IMAGE_ID, EXPECTED_IMAGE_ID, True),
+        (EXPECTED_IMAGE_ID.upper(), FULL_IMAGE_ID, True),  # Different case
+        ("", FULL_IMAGE_ID, False),  # Empty input
+        (EXPECTED_IMAGE_ID, "", False),
+        ("", "", False),
+        ("0123456789aa", FULL_IMAGE_ID, False),  # Same prefix, different ending
+        (FULL_IMAGE_ID[:-1] + "0", FULL_IMAGE_ID, False),
+    ],
+)
+def test_same_image(a: str, b: str, same: bool) -> None:
+    assert _same_image(a, b) is same
+
+
+@pytest.fixture
+def small_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use small chunks, so that the data do not fit in the queue at once."""
+    monkeypatch.setattr(container, "INSTALL_CHUNK_SIZE", 1024)
+    monkeypatch.setattr(container, "INSTALL_QUEUE_SIZE", 2)
+
+
+def gzip_reader(data: bytes) -> gzip.GzipFile:
+    return gzip.GzipFile(fileobj=io.BytesIO(gzip.compress(data)))
+
+
+class BrokenPipe(io.BytesIO):
+    def write(self, data: bytes) -> int:  # type: ignore [override]
+        raise BrokenPipeError()
+
+
+def test_copy_in_background(small_chunks: None) -> None:
+    data = os.urandom(100 * 1024)
+    dst = io.BytesIO()
+    _copy_in_background(gzip_reader(data), dst)
+    assert dst.getvalue() == data
+
+
+def test_copy_in_background_broken_pipe(small_chunks: None) -> None:
+    threads = threading.active_count()
+    with pytest.raises(BrokenPipeError):
+        _copy_in_background(gzip_reader(os.urandom(100 * 1024)), BrokenPipe())
+    # Make sure that the reader thread has exited, instead of blocking on the queue.
+    assert threading.active_count() == threads
+
+
+def test_copy_in_background_reader_error(small_chunks: None) -> None:
+    corrupted = gzip.compress(os.urandom(100 * 1024))[:-100]
+    src = gzip.GzipFile(fileobj=io.BytesIO(corrupted))
+    with pytest.raises(EOFError):
+        _copy_in_background(src, io.BytesIO())